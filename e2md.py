@@ -1,43 +1,67 @@
+import numpy as np
 import pandas as pd
-from tabulate import tabulate
 import os
 import sys
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+CHUNK_ROWS = 50000  # 1チャンクあたりの行数
+
+def open_excel_file(input_file):
+    """Excelファイルを開く(calamineがあれば高速なRustパーサを使用)"""
+    try:
+        return pd.ExcelFile(input_file, engine='calamine')
+    except ImportError:
+        return pd.ExcelFile(input_file, engine='openpyxl',
+                            engine_kwargs={'read_only': True, 'data_only': True})
+
 def escape_newlines(df):
     """セル内の改行をエスケープする"""
-    return df.applymap(lambda x: x.replace('\n', '\\n') if isinstance(x, str) else x)
-
-def clean_markdown_lines(markdown_array):
-    """Markdownテキストの余分なスペースを削除"""
-    cleaned_lines = []
-    for line in markdown_array:
-        if '|' in line:
-            parts = line.split('|')
-            cleaned_parts = [part.strip() for part in parts]
-            cleaned_line = '|'.join(cleaned_parts)
-            cleaned_lines.append(cleaned_line)
-        else:
-            cleaned_lines.append(line)
-    return cleaned_lines
-
-def convert_to_markdown_array(df):
-    """DataFrameからMarkdown形式の配列に変換"""
-    df_escaped = escape_newlines(df.fillna(''))
-    markdown_array = tabulate(df_escaped, tablefmt="pipe", headers="keys", showindex=False).split('\n')
-    return clean_markdown_lines(markdown_array)
-
-def save_markdown(markdown_array, output_file, encoding):
-    """Markdown配列をファイルに保存"""
-    with open(output_file, 'w', encoding=encoding, errors='replace') as f:
-        for line in markdown_array:
-            f.write(line + '\n')
+    out = df.copy()
+    for col in out.select_dtypes(include=['object', 'string']).columns:
+        out[col] = out[col].str.replace('\n', '\\n', regex=False)
+    return out
+
+def format_markdown_rows(df):
+    """DataFrameの各行をMarkdownテーブルの行に変換"""
+    df_escaped = escape_newlines(df)
+    if df_escaped.shape[1] == 0:
+        return []
+    if pa is not None:
+        cols = [pa.array(df_escaped[col], type=pa.string()) for col in df_escaped.columns]
+        joined = pc.binary_join_element_wise(*cols, ' | ')
+        return pc.binary_join_element_wise('| ', joined, ' |', '').to_pylist()
+    arr = df_escaped.to_numpy(dtype=object)
+    out = np.full(len(arr), '| ', dtype=object)
+    for k in range(arr.shape[1]):
+        out = out + arr[:, k] + (' | ' if k < arr.shape[1] - 1 else ' |')
+    return out.tolist()
+
+def convert_to_markdown_chunks(df, chunk_rows=CHUNK_ROWS):
+    """DataFrameからMarkdown行の配列をチャンク単位で生成"""
+    header = '| ' + ' | '.join(str(col) for col in df.columns) + ' |'
+    separator = '|' + '|'.join(['---'] * len(df.columns)) + '|'
+    yield [header, separator]
+    for start in range(0, len(df), chunk_rows):
+        yield format_markdown_rows(df.iloc[start:start + chunk_rows])
+
+def save_markdown(markdown_chunks, output_file, encoding):
+    """Markdown行のチャンクをファイルに保存"""
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        for lines in markdown_chunks:
+            f.write(('\n'.join(lines) + '\n').encode(encoding, errors='replace'))
     print(f"Markdown file saved as {output_file}, encoding: {encoding}")
 
 def process_excel_to_markdown(input_file, output_file, encoding='utf-8'):
     """Excelファイルを読み込み、Markdownに変換して保存"""
-    df = pd.read_excel(input_file, na_filter=False)  # ExcelデータをDataFrameとして読み込む
-    markdown_array = convert_to_markdown_array(df)  # DataFrameをMarkdown形式の配列に変換
-    save_markdown(markdown_array, output_file, encoding)  # Markdownデータをファイルに保存
+    with open_excel_file(input_file) as xls:
+        df = pd.read_excel(xls, dtype=str, na_filter=False)  # Excelデータを文字列DataFrameとして読み込む
+    markdown_chunks = convert_to_markdown_chunks(df)  # DataFrameをMarkdown形式のチャンクに変換
+    save_markdown(markdown_chunks, output_file, encoding)  # Markdownデータをファイルに保存
 
 def main():
     if len(sys.argv) < 2: